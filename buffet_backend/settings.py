@@ -124,4 +124,8 @@ STATIC_URL = 'static/'
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
-CORS_ALLOW_ALL_ORIGINS = True
\ No newline at end of file
+CORS_ALLOW_ALL_ORIGINS = True
+
+# Reject unknown tickers in FinancialDataView before calling yfinance.
+# Only applies once full exchange listings are loaded (python manage.py fetch_symbols).
+SYMBOL_VALIDATION_ENABLED = True
@@ -1,6 +1,13 @@
 import torch
 from transformers import T5Tokenizer, T5ForConditionalGeneration
 
+# Decoding settings used by the RAG endpoint
+DEFAULT_GENERATION_KWARGS = {
+    "num_beams": 4,
+    "early_stopping": True,
+    "length_penalty": 1.1,
+}
+
 class T5Generator:
     def __init__(self, model_name='t5-small', max_length=256):
         self.tokenizer = T5Tokenizer.from_pretrained(model_name)
@@ -8,25 +15,30 @@ class T5Generator:
         self.max_length = max_length
         print(f"T5 Generator initialized with model: {model_name}") # Keep init message
 
-    def generate(self, prompt: str) -> str:
-        input_ids = self.tokenizer.encode(
+    def encode(self, prompt: str):
+        return self.tokenizer.encode(
             prompt,
             return_tensors='pt',
             max_length=512, # Context length limit
             truncation=True
         )
 
+    def generate_ids(self, input_ids, **generation_kwargs):
         with torch.no_grad():
-            output_ids = self.model.generate(
+            return self.model.generate(
                 input_ids,
                 max_length=self.max_length,
-                num_beams=4,
-                early_stopping=True,
-                length_penalty=1.1
+                **generation_kwargs
             )
 
-        answer = self.tokenizer.decode(
+    def decode(self, output_ids) -> str:
+        return self.tokenizer.decode(
             output_ids[0],
             skip_special_tokens=True
         )
-        return answer
\ No newline at end of file
+
+    def generate(self, prompt: str, **generation_kwargs) -> str:
+        input_ids = self.encode(prompt)
+        # Caller-supplied settings replace the defaults wholesale (e.g. greedy must not inherit length_penalty)
+        output_ids = self.generate_ids(input_ids, **(generation_kwargs or DEFAULT_GENERATION_KWARGS))
+        return self.decode(output_ids)
@@ -1,12 +1,20 @@
 from .retriever import SimpleQARetriever
 from .generator import T5Generator
 import os
+import re
 
 # Corrected path calculation assuming interface.py is in financials_api/
 CORPUS_DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
 CORPUS_FILENAME = "qa_corpus.csv"
 CORPUS_FILE_PATH = os.path.join(CORPUS_DATA_DIR, CORPUS_FILENAME)
 
+# Best retrieval score above which the stored answer is returned as-is, skipping T5
+EXTRACTIVE_SIMILARITY_THRESHOLD = float(os.environ.get("RAG_EXTRACTIVE_THRESHOLD", "0.85"))
+# TF-IDF drops stop words and unseen words, so the fast path also requires the same word sequence.
+# Contractions are expanded and these filler words ignored; any other added, missing or changed word disqualifies.
+CONTRACTIONS = {"n't": " not", "'s": " is", "'re": " are", "'ve": " have", "'m": " am", "'ll": " will", "'d": " would"}
+IGNORED_TOKENS = {"a", "an", "the", "please"}
+
 retriever = None
 generator = None
 
@@ -21,18 +29,44 @@ except Exception as e:
     print(f"CRITICAL WARNING: Failed to initialize T5 Generator: {e}. RAG endpoint will fail.")
 
 
-def answer_question(query: str, k: int = 4) -> dict:
-    if retriever is None or generator is None:
-        return {"answer": "Error: RAG components not available."}
-
-    top_docs = retriever.retrieve_top_k(query, k=k)
-
+def build_prompt(query: str, top_docs: list) -> str:
     if not top_docs:
         context_str = "No relevant context found."
     else:
         context_str = "\n".join([doc["text"] for doc in top_docs]) # Use answers as context
 
-    prompt = f"question: {query}\ncontext: {context_str}\nanswer:"
+    return f"question: {query}\ncontext: {context_str}\nanswer:"
+
+
+def _question_tokens(text: str) -> list:
+    text = text.lower().replace("\u2019", "'").replace("won't", "will not").replace("can't", "can not")
+    for suffix, expansion in CONTRACTIONS.items():
+        text = text.replace(suffix, expansion)
+    return [token for token in re.findall(r"\w+", text) if token not in IGNORED_TOKENS]
+
+
+def is_near_verbatim(query: str, matched_question: str) -> bool:
+    return _question_tokens(query) == _question_tokens(matched_question)
+
+
+def answer_question(query: str, k: int = 4, threshold: float = None) -> dict:
+    if threshold is None:
+        threshold = EXTRACTIVE_SIMILARITY_THRESHOLD
+
+    if retriever is None:
+        return {"answer": "Error: RAG components not available."}
+
+    top_docs = retriever.retrieve_top_k(query, k=k)
+
+    # Near-verbatim match of a corpus question: the stored answer is the answer
+    if (top_docs and top_docs[0]["similarity"] >= threshold
+            and is_near_verbatim(query, top_docs[0]["matched_question"])):
+        return {"answer": top_docs[0]["text"].strip(), "path": "extractive"}
+
+    if generator is None:
+        return {"answer": "Error: RAG components not available."}
+
+    prompt = build_prompt(query, top_docs)
 
     try:
         generated_answer = generator.generate(prompt)
@@ -40,4 +74,4 @@ def answer_question(query: str, k: int = 4) -> dict:
         print(f"Error during T5 generation: {e}")
         return {"answer": "Error generating answer from retrieved context."}
 
-    return {"answer": generated_answer.strip()}
\ No newline at end of file
+    return {"answer": generated_answer.strip(), "path": "generative"}
\ No newline at end of file
@@ -0,0 +1,178 @@
+import csv
+import json
+import os
+import subprocess
+import time
+
+import numpy as np
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from ...generator import DEFAULT_GENERATION_KWARGS
+from ...retriever import SimpleQARetriever
+
+# Resolved here rather than imported from interface.py, which loads T5 on import
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data")
+DEFAULT_CORPUS_PATH = os.path.join(DATA_DIR, "qa_corpus.csv")
+DEFAULT_QUERIES_PATH = os.path.join(DATA_DIR, "rag_bench_queries.csv")
+
+# Decoding configurations compared by the generation benchmark
+DECODING_CONFIGS = {
+    "production": DEFAULT_GENERATION_KWARGS,
+    "beam2": {"num_beams": 2, "early_stopping": True, "length_penalty": 1.1},
+    "greedy": {"num_beams": 1, "early_stopping": False},
+}
+
+
+def load_labelled_queries(path):
+    """Reads `query,expected_question` rows (same CSV layout as the corpus)."""
+    queries = []
+    with open(path, 'r', encoding='utf-8') as f:
+        reader = csv.reader(f, quotechar='"', delimiter=',', skipinitialspace=True)
+        for row in reader:
+            if len(row) == 2:
+                queries.append((row[0].strip(), row[1].strip()))
+    return queries
+
+
+def latency_summary(samples_ms):
+    """Distribution summary (milliseconds) for a list of timings."""
+    if not samples_ms:
+        return {}
+    arr = np.asarray(samples_ms, dtype=float)
+    return {
+        "count": int(arr.size),
+        "mean": float(arr.mean()),
+        "min": float(arr.min()),
+        "p50": float(np.percentile(arr, 50)),
+        "p90": float(np.percentile(arr, 90)),
+        "p99": float(np.percentile(arr, 99)),
+        "max": float(arr.max()),
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], cwd=settings.BASE_DIR, stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except Exception:
+        return None
+
+
+class Command(BaseCommand):
+    help = "Benchmarks the RAG retriever (latency, recall@k, MRR) and T5 generator (latency per decoding config) offline."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--queries', default=DEFAULT_QUERIES_PATH, help="CSV of `query,expected_question` rows.")
+        parser.add_argument('--corpus', default=DEFAULT_CORPUS_PATH, help="Q&A corpus CSV.")
+        parser.add_argument('--k', type=int, default=4, help="Number of documents retrieved per query.")
+        parser.add_argument('--runs', type=int, default=20, help="Timed retrieval passes over the query set.")
+        parser.add_argument('--generation-queries', type=int, default=5, help="Queries used for the generation benchmark.")
+        parser.add_argument('--decoding', nargs='+', default=list(DECODING_CONFIGS), choices=list(DECODING_CONFIGS))
+        parser.add_argument('--skip-generation', action='store_true', help="Only benchmark the retriever.")
+        parser.add_argument('--output', default=None, help="Write JSON results to this path (stdout otherwise).")
+
+    def handle(self, *args, **options):
+        for option in ('k', 'runs', 'generation_queries'):
+            if options[option] < 1:
+                raise CommandError(f"--{option.replace('_', '-')} must be at least 1.")
+
+        corpus_path = options['corpus']
+        try:
+            queries = load_labelled_queries(options['queries'])
+            retriever = SimpleQARetriever(corpus_path=corpus_path)
+        except FileNotFoundError as e:
+            raise CommandError(str(e))
+        if not queries:
+            raise CommandError(f"No labelled queries found in {options['queries']}")
+
+        results = {
+            "commit": git_commit(),
+            "timestamp": time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+            "corpus": os.path.basename(corpus_path),
+            "num_queries": len(queries),
+            "retrieval": self.bench_retrieval(retriever, queries, options['k'], options['runs']),
+        }
+
+        if not options['skip_generation']:
+            results["generation"] = self.bench_generation(
+                retriever, queries[:options['generation_queries']], options['k'], options['decoding']
+            )
+
+        payload = json.dumps(results, indent=2)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                f.write(payload + "\n")
+            self.stdout.write(self.style.SUCCESS(f"Benchmark results written to {options['output']}"))
+        else:
+            self.stdout.write(payload)
+
+    def bench_retrieval(self, retriever, queries, k, runs):
+        # Quality: relevance is judged by the matched question text, so duplicated corpus rows count as hits
+        hits = 0
+        reciprocal_ranks = []
+        for query, expected in queries:
+            docs = retriever.retrieve_top_k(query, k=k)
+            rank = next((i + 1 for i, doc in enumerate(docs) if doc["matched_question"] == expected), None)
+            hits += rank is not None
+            reciprocal_ranks.append(1.0 / rank if rank else 0.0)
+
+        # Latency: one warm-up pass, then `runs` timed passes
+        for query, _ in queries:
+            retriever.retrieve_top_k(query, k=k)
+        timings_ms = []
+        for _ in range(runs):
+            for query, _ in queries:
+                start = time.perf_counter()
+                retriever.retrieve_top_k(query, k=k)
+                timings_ms.append((time.perf_counter() - start) * 1000)
+
+        return {
+            "k": k,
+            f"recall@{k}": hits / len(queries),
+            "mrr": float(np.mean(reciprocal_ranks)),
+            "latency_ms": latency_summary(timings_ms),
+        }
+
+    def bench_generation(self, retriever, queries, k, config_names):
+        from ...interface import build_prompt, generator
+
+        if generator is None:
+            raise CommandError("T5 generator is not available; rerun with --skip-generation.")
+
+        prompts = [build_prompt(query, retriever.retrieve_top_k(query, k=k)) for query, _ in queries]
+        generator.generate(prompts[0])  # Warm-up
+
+        results = {}
+        for name in config_names:
+            generation_kwargs = DECODING_CONFIGS[name]
+            tokenize_ms, generate_ms, decode_ms, request_ms, per_token_ms = [], [], [], [], []
+            output_tokens = 0
+            for prompt in prompts:
+                t0 = time.perf_counter()
+                input_ids = generator.encode(prompt)
+                t1 = time.perf_counter()
+                output_ids = generator.generate_ids(input_ids, **generation_kwargs)
+                t2 = time.perf_counter()
+                generator.decode(output_ids)
+                t3 = time.perf_counter()
+
+                num_tokens = max(int(output_ids.shape[-1]) - 1, 1)  # Exclude the decoder start token
+                output_tokens += num_tokens
+                tokenize_ms.append((t1 - t0) * 1000)
+                generate_ms.append((t2 - t1) * 1000)
+                decode_ms.append((t3 - t2) * 1000)
+                request_ms.append((t3 - t0) * 1000)
+                per_token_ms.append((t2 - t1) * 1000 / num_tokens)
+
+            results[name] = {
+                "generation_kwargs": generation_kwargs,
+                "output_tokens": output_tokens,
+                "tokenize_ms": latency_summary(tokenize_ms),
+                "generate_ms": latency_summary(generate_ms),
+                "decode_ms": latency_summary(decode_ms),
+                "request_ms": latency_summary(request_ms),
+                "per_token_ms": latency_summary(per_token_ms),
+            }
+        return results
@@ -0,0 +1,33 @@
+import os
+import urllib.request
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ...symbols import LISTING_FILE_PATHS
+
+LISTING_BASE_URL = "https://www.nasdaqtrader.com/dynamic/SymDir/"
+
+
+class Command(BaseCommand):
+    help = "Downloads the NASDAQ Trader exchange listings used for full ticker search and validation."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--timeout', type=float, default=30, help="Per-file download timeout in seconds.")
+
+    def handle(self, *args, **options):
+        for path in LISTING_FILE_PATHS:
+            url = LISTING_BASE_URL + os.path.basename(path)
+            try:
+                with urllib.request.urlopen(url, timeout=options['timeout']) as response:
+                    content = response.read()
+            except Exception as e:
+                raise CommandError(f"Failed to download {url}: {e}")
+
+            # Write to a temp file first so a failed download never leaves a truncated listing behind
+            tmp_path = path + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+            self.stdout.write(self.style.SUCCESS(f"Saved {url} -> {path}"))
+
+        self.stdout.write("Restart the server to load the new listings.")
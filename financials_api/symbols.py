@@ -0,0 +1,171 @@
+import os
+import csv
+import re
+from bisect import bisect_left
+
+SYMBOLS_DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+SYMBOLS_FILENAME = "symbols.csv"
+SYMBOLS_FILE_PATH = os.path.join(SYMBOLS_DATA_DIR, SYMBOLS_FILENAME)
+# NASDAQ Trader symbol directory files (NASDAQ + NYSE/other exchanges); see `manage.py fetch_symbols`
+LISTING_FILENAMES = ("nasdaqlisted.txt", "otherlisted.txt")
+LISTING_FILE_PATHS = tuple(os.path.join(SYMBOLS_DATA_DIR, name) for name in LISTING_FILENAMES)
+
+# Loose ticker shape (e.g. AAPL, BRK-B, RDS.A, ^GSPC, EURUSD=X), checked before any network call
+SYMBOL_PATTERN = re.compile(r"^[A-Z0-9^][A-Z0-9.\-=^]{0,14}$")
+
+# Plain US ticker shape (AAPL, BRK-B): the only symbols the NASDAQ Trader listings can vouch for.
+# Anything else (RELIANCE.NS, 7203.T, ^GSPC, BTC-USD, EURUSD=X) is outside their universe.
+US_LISTING_PATTERN = re.compile(r"^[A-Z]{1,5}(-[A-Z])?$")
+
+# Longest symbol SYMBOL_PATTERN accepts; fuzzy matching is skipped for anything longer
+MAX_SYMBOL_LENGTH = 15
+
+# Characters used to build single-edit typo candidates for fuzzy symbol lookups
+SYMBOL_ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789.-"
+
+
+def _prefix_range(keys, prefix):
+    """Returns the [start, end) slice of the sorted `keys` that begin with `prefix`."""
+    start = bisect_left(keys, prefix)
+    end = bisect_left(keys, prefix + "\uffff")
+    return start, end
+
+
+def _read_listing(path):
+    """
+    Yields (symbol, name) from a pipe-delimited NASDAQ Trader listing file.
+    Symbols are converted to yfinance style (BRK.B -> BRK-B); test issues and the trailer line are skipped.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        reader = csv.reader(f, delimiter='|')
+        header = next(reader, [])
+        symbol_col = 0  # "Symbol" in nasdaqlisted.txt, "ACT Symbol" in otherlisted.txt
+        name_col = header.index("Security Name") if "Security Name" in header else 1
+        test_col = header.index("Test Issue") if "Test Issue" in header else None
+        for row in reader:
+            if len(row) <= name_col or row[0].startswith("File Creation Time"):
+                continue
+            if test_col is not None and len(row) > test_col and row[test_col] == "Y":
+                continue
+            # "Apple Inc. - Common Stock" -> "Apple Inc."
+            yield row[symbol_col].strip().replace(".", "-"), row[name_col].split(" - ")[0].strip()
+
+
+class SymbolIndex:
+    """
+    In-memory ticker lookup built from a local `SYMBOL,Company Name` CSV, plus full exchange listings when present.
+    Prefix queries are binary searches over sorted arrays; fuzzy queries try single-edit variants of the symbol.
+    `is_complete` is only True when every listing file loaded; even then the listings only cover plain US tickers (see `covers`).
+    """
+    def __init__(self, symbols_path: str, listing_paths=()):
+        self.symbols_path = symbols_path
+        self.names = {}  # SYMBOL -> company name
+
+        loaded_listings = 0
+        for path in listing_paths:
+            try:
+                for symbol, name in _read_listing(path):
+                    if symbol:
+                        self.names.setdefault(symbol.upper(), name)
+                loaded_listings += 1
+            except FileNotFoundError:
+                pass
+        self.is_complete = bool(listing_paths) and loaded_listings == len(listing_paths)
+
+        try:
+            with open(self.symbols_path, 'r', encoding='utf-8') as f:
+                reader = csv.reader(f, quotechar='"', delimiter=',', skipinitialspace=True)
+                for row in reader:
+                    if len(row) == 2 and row[0].strip():
+                        # Curated names take precedence over listing names
+                        self.names[row[0].strip().upper()] = row[1].strip()
+        except FileNotFoundError:
+            print(f"Error: Symbols file not found at {self.symbols_path}")
+            raise
+
+        if not self.names:
+            print("Warning: No symbols loaded from symbols file.")
+
+        self.symbol_keys = sorted(self.names)
+        # Every word of every company name, so "coca" and "cola" both find KO
+        name_entries = sorted(
+            (word, symbol)
+            for symbol, name in self.names.items()
+            for word in name.lower().replace("-", " ").split()
+        )
+        self.name_keys = [word for word, _ in name_entries]
+        self.name_symbols = [symbol for _, symbol in name_entries]
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol.strip().upper() in self.names
+
+    @staticmethod
+    def is_valid_format(symbol: str) -> bool:
+        return bool(SYMBOL_PATTERN.match(symbol.strip().upper()))
+
+    def covers(self, symbol: str) -> bool:
+        """True when absence from the index proves the symbol does not exist."""
+        return self.is_complete and bool(US_LISTING_PATTERN.match(symbol.strip().upper()))
+
+    def _entry(self, symbol: str, match: str) -> dict:
+        return {"symbol": symbol, "name": self.names[symbol], "match": match}
+
+    def _edit_candidates(self, symbol: str):
+        """All strings one insertion, deletion, substitution or transposition away from `symbol`."""
+        splits = [(symbol[:i], symbol[i:]) for i in range(len(symbol) + 1)]
+        for left, right in splits:
+            if right:
+                yield left + right[1:]
+                for c in SYMBOL_ALPHABET:
+                    yield left + c + right[1:]
+            if len(right) > 1:
+                yield left + right[1] + right[0] + right[2:]
+            for c in SYMBOL_ALPHABET:
+                yield left + c + right
+
+    def search(self, query: str, limit: int = 10) -> list:
+        """Exact, symbol-prefix, company-name-prefix, then fuzzy (one typo, ticker-length queries only) matches, without duplicates."""
+        query = query.strip()
+        if not query or limit <= 0:
+            return []
+
+        upper = query.upper()
+        results = []
+        seen = set()
+
+        def add(symbol, match):
+            if symbol not in seen and len(results) < limit:
+                seen.add(symbol)
+                results.append(self._entry(symbol, match))
+
+        if upper in self.names:
+            add(upper, "exact")
+
+        start, end = _prefix_range(self.symbol_keys, upper)
+        for i in range(start, min(end, start + limit)):
+            add(self.symbol_keys[i], "prefix")
+
+        lower = query.lower()
+        start, end = _prefix_range(self.name_keys, lower)
+        for i in range(start, end):
+            if len(results) >= limit:
+                break
+            add(self.name_symbols[i], "name")
+
+        # Candidate count grows with query length, so only try it for ticker-length queries
+        if len(upper) <= MAX_SYMBOL_LENGTH:
+            for candidate in self._edit_candidates(upper):
+                if len(results) >= limit:
+                    break
+                if candidate in self.names:
+                    add(candidate, "fuzzy")
+
+        return results
+
+
+symbol_index = None
+
+try:
+    symbol_index = SymbolIndex(symbols_path=SYMBOLS_FILE_PATH, listing_paths=LISTING_FILE_PATHS)
+except FileNotFoundError:
+    print(f"WARNING: Symbols file '{SYMBOLS_FILENAME}' not found in '{SYMBOLS_DATA_DIR}'. Symbol search and validation are disabled.")
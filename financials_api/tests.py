@@ -1,3 +1,288 @@
-from django.test import TestCase
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+from unittest import mock
 
-# Create your tests here.
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase, override_settings
+
+from financials_api import interface
+from financials_api.symbols import SymbolIndex
+from financials_api.views import financial_views, symbol_views
+
+SYMBOLS_CSV = """AAPL,Apple Inc.
+AAP,Advance Auto Parts Inc.
+AMAT,Applied Materials Inc.
+KO,The Coca-Cola Company
+KR,The Kroger Co.
+"""
+
+NASDAQ_LISTING = """Symbol|Security Name|Market Category|Test Issue|Financial Status|Round Lot Size|ETF|NextShares
+AAPL|Apple Inc. - Common Stock|Q|N|N|100|N|N
+ZXZZT|NASDAQ TEST STOCK|Q|Y|N|100|N|N
+File Creation Time: 1018202608:00|||||||
+"""
+
+OTHER_LISTING = """ACT Symbol|Security Name|Exchange|CQS Symbol|ETF|Round Lot Size|Test Issue|NASDAQ Symbol
+BRK.B|Berkshire Hathaway Inc. - Class B|N|BRK.B|N|100|N|BRK=B
+"""
+
+
+class StubRetriever:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def retrieve_top_k(self, query, k=3):
+        return self.docs[:k]
+
+
+class StubGenerator:
+    def generate(self, prompt, **generation_kwargs):
+        return " generated answer "
+
+
+def corpus_doc(question, answer, similarity):
+    return {"doc_name": "qa_corpus.csv", "similarity": similarity, "text": answer, "matched_question": question}
+
+
+class AnswerQuestionPathTests(SimpleTestCase):
+    def answer(self, query, docs):
+        with mock.patch.object(interface, "retriever", StubRetriever(docs)), \
+             mock.patch.object(interface, "generator", StubGenerator()):
+            return interface.answer_question(query, threshold=0.85)
+
+    def test_near_verbatim_match_returns_stored_answer(self):
+        docs = [corpus_doc("What is your favorite movie?", "Stored answer.", 1.0)]
+        result = self.answer("what's your favorite movie", docs)
+        self.assertEqual(result, {"answer": "Stored answer.", "path": "extractive"})
+
+    def test_high_tfidf_score_with_different_wording_generates(self):
+        # Stop words and unseen words are dropped by TF-IDF, so these score 1.0 against shorter questions
+        cases = [
+            ("What is your least favorite movie?", "What is your favorite movie?"),
+            ("How do you define success for a startup founder?", "How do you define success?"),
+            ("Is it not better to pay off debt or invest extra money?", "Is it better to pay off debt or invest extra money?"),
+            ("How unimportant is a company's management team in your investment decisions?",
+             "How important is a company's management team in your investment decisions?"),
+        ]
+        for query, matched in cases:
+            with self.subTest(query=query):
+                result = self.answer(query, [corpus_doc(matched, "Stored answer.", 1.0)])
+                self.assertEqual(result, {"answer": "generated answer", "path": "generative"})
+
+    def test_low_tfidf_score_generates(self):
+        docs = [corpus_doc("What is your favorite movie?", "Stored answer.", 0.4)]
+        result = self.answer("What is your favorite movie?", docs)
+        self.assertEqual(result["path"], "generative")
+
+
+class BenchRagCommandTests(SimpleTestCase):
+    def test_retrieval_benchmark_writes_json(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output = os.path.join(tmpdir, "bench.json")
+            call_command('bench_rag', '--skip-generation', '--runs', '1', '--output', output, stdout=io.StringIO())
+            with open(output, encoding='utf-8') as f:
+                results = json.load(f)
+
+        retrieval = results["retrieval"]
+        self.assertGreater(results["num_queries"], 0)
+        self.assertTrue(0.0 <= retrieval["recall@4"] <= 1.0)
+        self.assertTrue(0.0 <= retrieval["mrr"] <= retrieval["recall@4"])
+        self.assertEqual(retrieval["latency_ms"]["count"], results["num_queries"])
+        self.assertIn("p50", retrieval["latency_ms"])
+        self.assertNotIn("generation", results)
+
+    def test_counts_must_be_positive(self):
+        for option in ('--runs', '--k', '--generation-queries'):
+            with self.subTest(option=option), self.assertRaises(CommandError):
+                call_command('bench_rag', '--skip-generation', option, '0')
+
+
+class SymbolFixtureTestCase(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        cls.paths = {}
+        for name, content in (("symbols.csv", SYMBOLS_CSV), ("nasdaqlisted.txt", NASDAQ_LISTING), ("otherlisted.txt", OTHER_LISTING)):
+            cls.paths[name] = os.path.join(cls.tmpdir.name, name)
+            with open(cls.paths[name], 'w', encoding='utf-8') as f:
+                f.write(content)
+        cls.index = SymbolIndex(cls.paths["symbols.csv"])
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmpdir.cleanup()
+        super().tearDownClass()
+
+
+class SymbolIndexTests(SymbolFixtureTestCase):
+    def search(self, query, limit=10):
+        return [(r["symbol"], r["match"]) for r in self.index.search(query, limit=limit)]
+
+    def test_exact_match_first_and_not_repeated_as_prefix(self):
+        self.assertEqual(self.search("aap"), [("AAP", "exact"), ("AAPL", "prefix")])
+
+    def test_company_name_word_prefix(self):
+        self.assertEqual(self.search("cola"), [("KO", "name")])
+        self.assertEqual(self.search("appl"), [("AAPL", "name"), ("AMAT", "name")])
+
+    def test_fuzzy_single_typo(self):
+        self.assertEqual(self.search("KP"), [("KO", "fuzzy"), ("KR", "fuzzy")])
+
+    def test_long_query_skips_fuzzy_pass(self):
+        with mock.patch.object(self.index, "_edit_candidates") as candidates:
+            self.assertEqual(self.search("A" * 16), [])
+        candidates.assert_not_called()
+
+    def test_limit(self):
+        self.assertEqual(self.search("A", limit=2), [("AAP", "prefix"), ("AAPL", "prefix")])
+        self.assertEqual(self.search("A", limit=0), [])
+        self.assertEqual(self.search("   "), [])
+
+    def test_curated_list_alone_is_not_complete(self):
+        self.assertFalse(self.index.is_complete)
+
+    def test_exchange_listings(self):
+        index = SymbolIndex(
+            self.paths["symbols.csv"],
+            listing_paths=(self.paths["nasdaqlisted.txt"], self.paths["otherlisted.txt"]),
+        )
+        self.assertTrue(index.is_complete)
+        self.assertIn("BRK-B", index)
+        self.assertNotIn("ZXZZT", index)  # Test issue
+        self.assertEqual(index.names["BRK-B"], "Berkshire Hathaway Inc.")  # " - Class B" suffix dropped
+
+    def test_missing_listing_is_not_complete(self):
+        index = SymbolIndex(self.paths["symbols.csv"], listing_paths=(self.paths["nasdaqlisted.txt"], "/nonexistent.txt"))
+        self.assertFalse(index.is_complete)
+
+
+class SymbolViewTests(SymbolFixtureTestCase):
+    def setUp(self):
+        self.complete_index = SymbolIndex(
+            self.paths["symbols.csv"],
+            listing_paths=(self.paths["nasdaqlisted.txt"], self.paths["otherlisted.txt"]),
+        )
+
+    def test_search_limit_is_clamped(self):
+        with mock.patch.object(symbol_views, "symbol_index", self.complete_index), \
+             mock.patch.object(symbol_views, "MAX_SEARCH_RESULTS", 2):
+            response = self.client.get("/api/symbols/search", {"q": "a", "limit": 100})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["results"]), 2)
+
+    def test_unknown_symbol_404_with_suggestions_and_no_fetch(self):
+        with mock.patch.object(financial_views, "symbol_index", self.complete_index), \
+             mock.patch.object(financial_views.yf, "Ticker") as ticker:
+            response = self.client.get("/api/financials/AAPK/")
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual([s["symbol"] for s in response.json()["suggestions"]], ["AAP", "AAPL"])
+        ticker.assert_not_called()
+
+    def test_long_search_query_400(self):
+        with mock.patch.object(symbol_views, "symbol_index", self.complete_index):
+            response = self.client.get("/api/symbols/search", {"q": "A" * 3000})
+        self.assertEqual(response.status_code, 400)
+
+    def test_symbols_outside_listing_universe_defer_to_yfinance(self):
+        for symbol in ("RELIANCE.NS", "^GSPC", "BTC-USD", "EURUSD=X"):
+            with self.subTest(symbol=symbol), \
+                 mock.patch.object(financial_views, "symbol_index", self.complete_index), \
+                 mock.patch.object(financial_views.yf, "Ticker", side_effect=RuntimeError("offline")) as ticker:
+                self.client.get(f"/api/financials/{symbol}/")
+            ticker.assert_called_once_with(symbol)
+
+    def test_incomplete_index_defers_to_yfinance(self):
+        with mock.patch.object(financial_views, "symbol_index", self.index), \
+             mock.patch.object(financial_views.yf, "Ticker", side_effect=RuntimeError("offline")) as ticker:
+            self.client.get("/api/financials/SHOP/")
+        ticker.assert_called_once_with("SHOP")
+
+    @override_settings(SYMBOL_VALIDATION_ENABLED=False)
+    def test_validation_can_be_disabled(self):
+        with mock.patch.object(financial_views, "symbol_index", self.complete_index), \
+             mock.patch.object(financial_views.yf, "Ticker", side_effect=RuntimeError("offline")) as ticker:
+            self.client.get("/api/financials/AAPK/")
+        ticker.assert_called_once_with("AAPK")
+
+    def test_malformed_symbol_400(self):
+        with mock.patch.object(financial_views.yf, "Ticker") as ticker:
+            response = self.client.get("/api/financials/BAD$SYMBOL/")
+        self.assertEqual(response.status_code, 400)
+        ticker.assert_not_called()
+
+
+class BlockingStock:
+    """ Stand-in for yf.Ticker: `financials` blocks until released, the other statements record access. """
+    ticker = "SLOW"
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.accessed = []
+
+    @property
+    def financials(self):
+        self.release.wait(5)
+        return financial_views.pd.DataFrame({"2024-12-31": [1]})
+
+    @property
+    def balance_sheet(self):
+        self.accessed.append("balance_sheet")
+        return financial_views.pd.DataFrame({"2024-12-31": [1]})
+
+    @property
+    def cashflow(self):
+        self.accessed.append("cashflow")
+        raise RuntimeError("cash flow unavailable")
+
+
+class FetchStatementsTests(SimpleTestCase):
+    def test_cash_flow_failure_is_not_a_timeout(self):
+        stock = BlockingStock()
+        stock.release.set()
+        (income_stmt, balance_sheet, cash_flow), timed_out = financial_views.fetch_statements(stock, timeout=5)
+        self.assertFalse(income_stmt.empty)
+        self.assertFalse(balance_sheet.empty)
+        self.assertTrue(cash_flow.empty)
+        self.assertEqual(timed_out, set())
+
+    def test_hung_statement_times_out_without_blocking_the_others(self):
+        stock = BlockingStock()
+        try:
+            start = time.monotonic()
+            (income_stmt, balance_sheet, _), timed_out = financial_views.fetch_statements(stock, timeout=0.1)
+            elapsed = time.monotonic() - start
+        finally:
+            stock.release.set()
+        self.assertEqual(timed_out, {"financials"})
+        self.assertTrue(income_stmt.empty)
+        self.assertFalse(balance_sheet.empty)
+        self.assertLess(elapsed, 2)
+
+    def test_hung_requests_do_not_starve_later_requests(self):
+        # More hung fetches than a shared pool would have workers
+        hung = [BlockingStock() for _ in range(15)]
+        try:
+            for stock in hung:
+                financial_views.fetch_statements(stock, timeout=0.01)
+            healthy = BlockingStock()
+            healthy.release.set()
+            (income_stmt, balance_sheet, _), timed_out = financial_views.fetch_statements(healthy, timeout=1)
+        finally:
+            for stock in hung:
+                stock.release.set()
+        self.assertEqual(timed_out, set())
+        self.assertFalse(income_stmt.empty)
+        self.assertFalse(balance_sheet.empty)
+
+    def test_view_returns_504_on_timeout(self):
+        empty = financial_views.pd.DataFrame()
+        with mock.patch.object(financial_views, "symbol_index", None), \
+             mock.patch.object(financial_views.yf, "Ticker"), \
+             mock.patch.object(financial_views, "fetch_statements", return_value=((empty, empty, empty), {"financials"})):
+            response = self.client.get("/api/financials/AAPL/")
+        self.assertEqual(response.status_code, 504)
@@ -1,11 +1,13 @@
-from django.urls import path
+from django.urls import path, re_path
 
 from financials_api.views.chatbot_views import ChatbotView
 from financials_api.views.financial_views import FinancialDataView
 from financials_api.views.rag_view import RAGView
+from financials_api.views.symbol_views import SymbolSearchView
 
 urlpatterns = [
     path('financials/<str:stock_symbol>/', FinancialDataView.as_view(), name='financial-data'),
     path('chatbot/', ChatbotView.as_view(), name='chatbot'), # Gemini endpoint
     path('ragbot/', RAGView.as_view(), name='ragbot'),    # RAG endpoint
+    re_path(r'^symbols/search/?$', SymbolSearchView.as_view(), name='symbol-search'), # Ticker autocomplete
 ]
\ No newline at end of file
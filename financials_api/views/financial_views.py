@@ -7,6 +7,13 @@ import yfinance as yf
 import pandas as pd
 import numpy as np
 import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from django.conf import settings
+from ..symbols import SymbolIndex, symbol_index
+
+# Each yfinance statement property is its own blocking fetch, so a request runs them side by side
+STATEMENT_FETCH_TIMEOUT = 15  # seconds, per statement
+STATEMENT_ATTRIBUTES = ('financials', 'balance_sheet', 'cashflow')
 
 # Helper function to safely get data from DataFrame
 def safe_get(df, key, year_index=0):
@@ -27,6 +34,40 @@ def safe_get(df, key, year_index=0):
     except KeyError:
         return 'N/A' # Key (financial item) not found
 
+# Helper function to fetch the annual statements concurrently
+def fetch_statements(stock, timeout=STATEMENT_FETCH_TIMEOUT):
+    """
+    Fetches income statement, balance sheet and cash flow in parallel.
+    A statement that errors or exceeds `timeout` comes back as an empty DataFrame,
+    so a missing cash flow does not hold up ratios from the other two.
+    Returns ((income_stmt, balance_sheet, cash_flow), timed_out) where timed_out is the set of attribute names that timed out.
+    """
+    # One worker per statement and one executor per request: every fetch starts immediately, and a
+    # hung upstream call only ties up this request's threads instead of a pool shared with other requests
+    executor = ThreadPoolExecutor(max_workers=len(STATEMENT_ATTRIBUTES), thread_name_prefix="yf-statement")
+    try:
+        futures = {name: executor.submit(getattr, stock, name) for name in STATEMENT_ATTRIBUTES}
+        deadline = time.monotonic() + timeout
+
+        statements = {}
+        timed_out = set()
+        for name, future in futures.items():
+            try:
+                # Futures run concurrently, so all three share one deadline
+                df = future.result(timeout=max(deadline - time.monotonic(), 0))
+                statements[name] = df if isinstance(df, pd.DataFrame) else pd.DataFrame()
+            except FutureTimeoutError:
+                print(f"Timed out fetching {name} for {stock.ticker}")
+                timed_out.add(name)
+                statements[name] = pd.DataFrame()
+            except Exception as e:
+                print(f"Error fetching {name} for {stock.ticker}: {e}")
+                statements[name] = pd.DataFrame()
+    finally:
+        # Don't wait on a hung fetch; its thread exits on its own once yfinance returns
+        executor.shutdown(wait=False, cancel_futures=True)
+    return (statements['financials'], statements['balance_sheet'], statements['cashflow']), timed_out
+
 # Helper function to format numbers or return N/A
 def format_value(value, precision=2, percentage=False):
     """Formats numeric values, returns 'N/A' if input is 'N/A'."""
@@ -70,15 +111,39 @@ class FinancialDataView(APIView):
         Handles GET requests to /api/financials/<stock_symbol>/
         Fetches data from yfinance, calculates ratios, and returns JSON response.
         """
+        if not SymbolIndex.is_valid_format(stock_symbol):
+            return Response(
+                {"error": f"Invalid stock symbol format: {stock_symbol}."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        # Reject unknown symbols locally instead of paying a yfinance round trip for a 404.
+        # Only trusted for plain US tickers with full exchange listings loaded; everything else defers to yfinance.
+        if (getattr(settings, 'SYMBOL_VALIDATION_ENABLED', True)
+                and symbol_index is not None and symbol_index.covers(stock_symbol)
+                and stock_symbol not in symbol_index):
+            return Response(
+                {
+                    "error": f"Unknown stock symbol: {stock_symbol}.",
+                    "suggestions": symbol_index.search(stock_symbol, limit=5),
+                },
+                status=status.HTTP_404_NOT_FOUND
+            )
+
         try:
             stock = yf.Ticker(stock_symbol)
 
             # Fetch annual data
-            # Use .financials for Income Statement, .balance_sheet, .cashflow
+            # Use .financials for Income Statement, .balance_sheet, .cashflow (fetched concurrently)
             # yfinance might return empty DataFrames if data is unavailable
-            income_stmt = stock.financials
-            balance_sheet = stock.balance_sheet
-            cash_flow = stock.cashflow
+            (income_stmt, balance_sheet, cash_flow), timed_out = fetch_statements(stock)
+
+            # A slow upstream is not the same as missing data, so don't report it as an invalid symbol
+            if timed_out & {'financials', 'balance_sheet'}:
+                 return Response(
+                     {"error": f"Timed out retrieving financial data for {stock_symbol}. Please try again later."},
+                     status=status.HTTP_504_GATEWAY_TIMEOUT
+                 )
 
             # Basic validation: Check if essential dataframes are non-empty
             if income_stmt.empty or balance_sheet.empty:
@@ -12,7 +12,10 @@ class RAGView(APIView):
             return Response({"reply": "No query (message) provided."}, status=status.HTTP_400_BAD_REQUEST)
         try:
             result = answer_question_rag(query)
-            return Response({"reply": result.get("answer", "Could not generate answer from knowledge base.")}, status=status.HTTP_200_OK)
+            return Response({
+                "reply": result.get("answer", "Could not generate answer from knowledge base."),
+                "path": result.get("path"),
+            }, status=status.HTTP_200_OK)
         except FileNotFoundError:
              print("Error: RAG corpus file not found.")
              return Response({"reply": "Error: RAG knowledge base not found."}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -0,0 +1,26 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from ..symbols import symbol_index
+
+MAX_SEARCH_RESULTS = 25
+MAX_QUERY_LENGTH = 64
+
+class SymbolSearchView(APIView):
+    """ Ticker autocomplete: prefix and fuzzy matches from the local symbol index (no network I/O). """
+    def get(self, request):
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            return Response({"error": "No search query (q) provided."}, status=status.HTTP_400_BAD_REQUEST)
+        if len(query) > MAX_QUERY_LENGTH:
+            return Response({"error": f"Search query must be at most {MAX_QUERY_LENGTH} characters."}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            limit = min(int(request.query_params.get('limit', 10)), MAX_SEARCH_RESULTS)
+        except ValueError:
+            return Response({"error": "limit must be an integer."}, status=status.HTTP_400_BAD_REQUEST)
+
+        if symbol_index is None:
+            return Response({"error": "Symbol index not available."}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+
+        return Response({"query": query, "results": symbol_index.search(query, limit=limit)}, status=status.HTTP_200_OK)